@@ -1,14 +1,74 @@
 """MCP server for Meta (Facebook/Instagram) ad campaign management."""
 
-import json
+import asyncio
+import logging
 import os
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from mcp.server.fastmcp import FastMCP
 
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj).decode()
+
+    def _dumps_pretty(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+    _loads = orjson.loads
+except ImportError:  # orjson is optional; fall back to the stdlib
+    import json
+
+    _dumps = json.dumps
+    _loads = json.loads
+
+    def _dumps_pretty(obj):
+        return json.dumps(obj, indent=2)
+
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx)
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+try:
+    from requests_toolbelt import MultipartEncoder
+except ImportError:  # requests-toolbelt is optional; uploads are buffered without it
+    MultipartEncoder = None
+
+
 mcp = FastMCP("meta-ads")
 
+# Upper bound on concurrent Graph API calls per tool invocation.
+MAX_WORKERS = 10
+
+# Dry-run request previews are logged at DEBUG. Set META_ADS_MCP_LOG_LEVEL to
+# change the level, or META_ADS_MCP_QUIET=1 as a shorthand for WARNING.
+QUIET = os.environ.get("META_ADS_MCP_QUIET") == "1"
+
+logger = logging.getLogger("meta_ads_mcp")
+if not logger.handlers:
+    _handler = logging.StreamHandler(sys.stderr)
+    _handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(_handler)
+    logger.propagate = False
+    _default_level = "WARNING" if QUIET else "DEBUG"
+    _level_name = (os.environ.get("META_ADS_MCP_LOG_LEVEL") or _default_level).upper()
+    # getLevelName maps known names to their int value (and anything else to a str).
+    if isinstance(logging.getLevelName(_level_name), int):
+        logger.setLevel(_level_name)
+    else:
+        logger.setLevel(_default_level)
+        logger.warning("Unknown META_ADS_MCP_LOG_LEVEL %r; using %s", _level_name, _default_level)
+
 
 # ---------------------------------------------------------------------------
 # Meta API client (self-contained, no click dependency)
@@ -23,8 +83,37 @@ class MetaAPIError(Exception):
         super().__init__(message)
 
 
-class MetaAdsAPI:
-    """Lightweight wrapper around the Meta Marketing API."""
+# ---------------------------------------------------------------------------
+# Targeting
+# ---------------------------------------------------------------------------
+
+def _build_targeting_spec(targeting):
+    """Return the serialized Graph API targeting spec for a targeting dict."""
+    targeting_spec = {
+        "age_min": targeting.get("age_min", 18),
+        "age_max": targeting.get("age_max", 65),
+        "genders": targeting.get("genders", [0]),
+        "geo_locations": {
+            "countries": targeting.get("countries", ["US"]),
+        },
+    }
+    if targeting.get("interests"):
+        targeting_spec["flexible_spec"] = [
+            {"interests": targeting["interests"]}
+        ]
+    platforms = targeting.get("platforms", ["facebook", "instagram"])
+    targeting_spec["publisher_platforms"] = platforms
+    if "facebook" in platforms:
+        targeting_spec["facebook_positions"] = targeting.get("facebook_positions", ["feed"])
+    if "instagram" in platforms:
+        targeting_spec["instagram_positions"] = targeting.get(
+            "instagram_positions", ["stream", "story", "reels"]
+        )
+    return _dumps(targeting_spec)
+
+
+class _MetaAdsBase:
+    """State and request building shared by the sync and async clients."""
 
     def __init__(self, access_token, ad_account_id, page_id, api_version="v21.0", dry_run=False):
         self.access_token = access_token
@@ -35,30 +124,37 @@ class MetaAdsAPI:
         self.base_url = f"https://graph.facebook.com/{api_version}"
         self.dry_run = dry_run
         self._dry_run_counter = 0
+        self._dry_run_lock = threading.Lock()
 
-    def _request(self, method, endpoint, **kwargs):
-        """Make an API request to the Meta Graph API."""
-        url = f"{self.base_url}/{endpoint}"
-        kwargs.setdefault("params", {})
-        kwargs["params"]["access_token"] = self.access_token
-
-        if self.dry_run:
+    def _next_dry_run_id(self):
+        with self._dry_run_lock:
             self._dry_run_counter += 1
-            fake_id = f"dry_run_{self._dry_run_counter}"
-            params = {k: v for k, v in kwargs.get("params", {}).items() if k != "access_token"}
-            print(f"[DRY RUN] {method} {endpoint}", file=sys.stderr)
+            return f"dry_run_{self._dry_run_counter}"
+
+    def _dry_run_response(self, method, endpoint, params):
+        """Preview a request on stderr and return a fake response."""
+        fake_id = self._next_dry_run_id()
+        if logger.isEnabledFor(logging.DEBUG):
             if params:
-                preview = json.dumps(params, indent=2)
+                preview = _dumps_pretty(params)
                 if len(preview) > 500:
                     preview = preview[:500] + "..."
-                print(f"  Params: {preview}", file=sys.stderr)
-            return {"id": fake_id}
-
-        resp = getattr(requests, method.lower())(url, **kwargs)
-
+                # One record per call, so the preview is a single write.
+                logger.debug("[DRY RUN] %s %s\n  Params: %s", method, endpoint, preview)
+            else:
+                logger.debug("[DRY RUN] %s %s", method, endpoint)
+        return {"id": fake_id}
+
+    @staticmethod
+    def _parse_response(resp):
+        """Decode a Graph API response body, raising MetaAPIError on failure.
+
+        Works with both requests and httpx responses. ``resp.text`` is only
+        decoded on the error path.
+        """
         if resp.status_code != 200:
             try:
-                error_data = resp.json().get("error", {})
+                error_data = _loads(resp.content).get("error", {})
                 message = error_data.get("message", resp.text)
                 error_code = error_data.get("code")
             except Exception:
@@ -66,118 +162,163 @@ class MetaAdsAPI:
                 error_code = None
             raise MetaAPIError(resp.status_code, message, error_code)
 
-        return resp.json()
+        return _loads(resp.content)
+
+    @staticmethod
+    def _image_hash(result):
+        images = result.get("images", {})
+        for key, val in images.items():
+            return val.get("hash")
+        raise MetaAPIError(0, f"Unexpected image upload response: {result}")
+
+    def _campaign_params(self, name, objective, status, special_ad_categories):
+        return {
+            "name": name,
+            "objective": objective,
+            "status": status,
+            "special_ad_categories": _dumps(special_ad_categories or []),
+            "is_adset_budget_sharing_enabled": "false",
+        }
+
+    def _ad_set_params(self, name, campaign_id, daily_budget, targeting,
+                       optimization_goal, billing_event, bid_strategy, status):
+        return {
+            "name": name,
+            "campaign_id": campaign_id,
+            "daily_budget": str(daily_budget),
+            "billing_event": billing_event,
+            "optimization_goal": optimization_goal,
+            "bid_strategy": bid_strategy,
+            "status": status,
+            "targeting": _build_targeting_spec(targeting),
+        }
+
+    def _ad_creative_params(self, name, image_hash, primary_text, headline, description, link, cta):
+        return {
+            "name": name,
+            "object_story_spec": _dumps({
+                "link_data": {
+                    "image_hash": image_hash,
+                    "link": link,
+                    "message": primary_text,
+                    "name": headline,
+                    "description": description,
+                    "call_to_action": {
+                        "type": cta,
+                        "value": {"link": link},
+                    },
+                },
+                "page_id": self.page_id,
+            }),
+        }
+
+    def _ad_params(self, name, ad_set_id, creative_id, status):
+        return {
+            "name": name,
+            "adset_id": ad_set_id,
+            "creative": _dumps({"creative_id": creative_id}),
+            "status": status,
+        }
+
+
+class MetaAdsAPI(_MetaAdsBase):
+    """Lightweight wrapper around the Meta Marketing API."""
+
+    def __init__(self, access_token, ad_account_id, page_id, api_version="v21.0", dry_run=False):
+        super().__init__(access_token, ad_account_id, page_id, api_version, dry_run)
+        # One pooled session per client so repeated calls to graph.facebook.com
+        # reuse the same TLS connection. Retry only covers idempotent methods.
+        # The token rides on the session so requests merges it into every call.
+        self.session = requests.Session()
+        self.session.params = {"access_token": access_token}
+        self.session.mount("https://", HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=MAX_WORKERS,
+            # raise_on_status=False hands the last failed response to
+            # _parse_response so callers still get MetaAPIError with Meta's
+            # message. 429 is deliberately not retried: a throttled call goes
+            # straight back to the caller rather than hitting the API again.
+            # Retry-After is ignored so a 5xx only costs the short backoff.
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[500, 502, 503, 504],
+                raise_on_status=False,
+                respect_retry_after_header=False,
+            ),
+        ))
+
+    def close(self):
+        """Close the underlying HTTP session and its pooled connections."""
+        self.session.close()
+
+    def _request(self, method, endpoint, **kwargs):
+        """Make an API request to the Meta Graph API."""
+        if self.dry_run:
+            return self._dry_run_response(method, endpoint, kwargs.get("params", {}))
+
+        url = f"{self.base_url}/{endpoint}"
+        resp = self.session.request(method, url, **kwargs)
+        return self._parse_response(resp)
+
+    def _create(self, endpoint, build_params, *args):
+        """POST a new object and return its ID.
+
+        Dry runs with previews disabled return a fake ID without building the
+        params at all.
+        """
+        if self.dry_run and not logger.isEnabledFor(logging.DEBUG):
+            return self._next_dry_run_id()
+        result = self._request("POST", endpoint, params=build_params(*args))
+        return result.get("id", "dry_run_id")
 
     def upload_image(self, image_path):
         """Upload an ad image. Returns the image hash."""
         from pathlib import Path
         path = Path(image_path)
         with open(path, "rb") as f:
-            result = self._request(
-                "POST",
-                f"{self.act_id}/adimages",
-                files={"filename": (path.name, f, "image/png")},
-            )
+            fields = {"filename": (path.name, f, "image/png")}
+            if MultipartEncoder is not None:
+                # Stream the multipart body in chunks instead of building it in memory.
+                encoder = MultipartEncoder(fields=fields)
+                upload = {"data": encoder, "headers": {"Content-Type": encoder.content_type}}
+            else:
+                upload = {"files": fields}
+            result = self._request("POST", f"{self.act_id}/adimages", **upload)
         if self.dry_run:
             return "dry_run_hash"
-        images = result.get("images", {})
-        for key, val in images.items():
-            return val.get("hash")
-        raise MetaAPIError(0, f"Unexpected image upload response: {result}")
+        return self._image_hash(result)
 
     def create_campaign(self, name, objective="OUTCOME_TRAFFIC", status="PAUSED", special_ad_categories=None):
         """Create an ad campaign. Returns the campaign ID."""
-        result = self._request(
-            "POST",
-            f"{self.act_id}/campaigns",
-            params={
-                "name": name,
-                "objective": objective,
-                "status": status,
-                "special_ad_categories": json.dumps(special_ad_categories or []),
-                "is_adset_budget_sharing_enabled": "false",
-            },
+        return self._create(
+            f"{self.act_id}/campaigns", self._campaign_params,
+            name, objective, status, special_ad_categories,
         )
-        return result.get("id", "dry_run_id")
 
     def create_ad_set(self, name, campaign_id, daily_budget, targeting,
                       optimization_goal="LINK_CLICKS", billing_event="IMPRESSIONS",
                       bid_strategy="LOWEST_COST_WITHOUT_CAP", status="PAUSED"):
         """Create an ad set with targeting. Returns the ad set ID."""
-        targeting_spec = {
-            "age_min": targeting.get("age_min", 18),
-            "age_max": targeting.get("age_max", 65),
-            "genders": targeting.get("genders", [0]),
-            "geo_locations": {
-                "countries": targeting.get("countries", ["US"]),
-            },
-        }
-        if targeting.get("interests"):
-            targeting_spec["flexible_spec"] = [
-                {"interests": targeting["interests"]}
-            ]
-        platforms = targeting.get("platforms", ["facebook", "instagram"])
-        targeting_spec["publisher_platforms"] = platforms
-        if "facebook" in platforms:
-            targeting_spec["facebook_positions"] = targeting.get("facebook_positions", ["feed"])
-        if "instagram" in platforms:
-            targeting_spec["instagram_positions"] = targeting.get(
-                "instagram_positions", ["stream", "story", "reels"]
-            )
-        result = self._request(
-            "POST",
-            f"{self.act_id}/adsets",
-            params={
-                "name": name,
-                "campaign_id": campaign_id,
-                "daily_budget": str(daily_budget),
-                "billing_event": billing_event,
-                "optimization_goal": optimization_goal,
-                "bid_strategy": bid_strategy,
-                "status": status,
-                "targeting": json.dumps(targeting_spec),
-            },
+        return self._create(
+            f"{self.act_id}/adsets", self._ad_set_params,
+            name, campaign_id, daily_budget, targeting,
+            optimization_goal, billing_event, bid_strategy, status,
         )
-        return result.get("id", "dry_run_id")
 
     def create_ad_creative(self, name, image_hash, primary_text, headline, description, link, cta="LEARN_MORE"):
         """Create an ad creative. Returns the creative ID."""
-        result = self._request(
-            "POST",
-            f"{self.act_id}/adcreatives",
-            params={
-                "name": name,
-                "object_story_spec": json.dumps({
-                    "link_data": {
-                        "image_hash": image_hash,
-                        "link": link,
-                        "message": primary_text,
-                        "name": headline,
-                        "description": description,
-                        "call_to_action": {
-                            "type": cta,
-                            "value": {"link": link},
-                        },
-                    },
-                    "page_id": self.page_id,
-                }),
-            },
+        return self._create(
+            f"{self.act_id}/adcreatives", self._ad_creative_params,
+            name, image_hash, primary_text, headline, description, link, cta,
         )
-        return result.get("id", "dry_run_id")
 
     def create_ad(self, name, ad_set_id, creative_id, status="PAUSED"):
         """Create an ad. Returns the ad ID."""
-        result = self._request(
-            "POST",
-            f"{self.act_id}/ads",
-            params={
-                "name": name,
-                "adset_id": ad_set_id,
-                "creative": json.dumps({"creative_id": creative_id}),
-                "status": status,
-            },
+        return self._create(
+            f"{self.act_id}/ads", self._ad_params,
+            name, ad_set_id, creative_id, status,
         )
-        return result.get("id", "dry_run_id")
 
     def get_campaign(self, campaign_id, fields="name,status,objective,daily_budget"):
         """Get campaign details."""
@@ -193,6 +334,31 @@ class MetaAdsAPI:
         result = self._request("GET", f"{campaign_id}/ads", params={"fields": fields})
         return result.get("data", [])
 
+    def batch(self, requests_list):
+        """Run several Graph API calls in one HTTP request via the batch endpoint.
+
+        Each item is a dict with ``method`` and ``relative_url`` (and optionally
+        ``body``). Returns the decoded body of each sub-response, in order.
+        """
+        result = self._request("POST", "", params={"batch": _dumps(requests_list)})
+        if self.dry_run:
+            return [{} for _ in requests_list]
+
+        bodies = []
+        for item in result:
+            if item is None:
+                raise MetaAPIError(0, "Batch sub-request did not complete")
+            body = _loads(item.get("body") or "{}")
+            if item.get("code") != 200:
+                error_data = body.get("error", {})
+                raise MetaAPIError(
+                    item.get("code"),
+                    error_data.get("message", item.get("body")),
+                    error_data.get("code"),
+                )
+            bodies.append(body)
+        return bodies
+
     def update_status(self, object_id, status):
         """Update the status of a campaign, ad set, or ad."""
         return self._request("POST", object_id, params={"status": status})
@@ -202,12 +368,110 @@ class MetaAdsAPI:
         return self.update_status(campaign_id, "DELETED")
 
 
+class AsyncMetaAdsAPI(_MetaAdsBase):
+    """Asyncio variant of MetaAdsAPI built on httpx.
+
+    Uses HTTP/2 when the ``h2`` package is installed, so concurrent calls are
+    multiplexed over a single TLS connection. Use as an async context manager
+    or call ``aclose()`` when done.
+    """
+
+    def __init__(self, access_token, ad_account_id, page_id, api_version="v21.0", dry_run=False):
+        super().__init__(access_token, ad_account_id, page_id, api_version, dry_run)
+        self.client = httpx.AsyncClient(
+            base_url=f"{self.base_url}/",
+            http2=_HTTP2,
+            # Send the token as a header: httpx logs request URLs at INFO, so a
+            # query-string token would end up in the server's stderr.
+            headers={"Authorization": f"Bearer {access_token}"},
+            limits=httpx.Limits(max_connections=MAX_WORKERS, max_keepalive_connections=MAX_WORKERS),
+            # httpx defaults to 5s for every phase, which large image uploads
+            # can exceed. Waiting for a pooled connection is never timed out.
+            timeout=httpx.Timeout(60.0, pool=None),
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def aclose(self):
+        """Close the underlying HTTP client and its pooled connections."""
+        await self.client.aclose()
+
+    async def _request(self, method, endpoint, **kwargs):
+        """Make an API request to the Meta Graph API."""
+        if self.dry_run:
+            return self._dry_run_response(method, endpoint, kwargs.get("params", {}))
+
+        resp = await self.client.request(method, endpoint, **kwargs)
+        return self._parse_response(resp)
+
+    async def _create(self, endpoint, build_params, *args):
+        """POST a new object and return its ID.
+
+        Dry runs with previews disabled return a fake ID without building the
+        params at all.
+        """
+        if self.dry_run and not logger.isEnabledFor(logging.DEBUG):
+            return self._next_dry_run_id()
+        result = await self._request("POST", endpoint, params=build_params(*args))
+        return result.get("id", "dry_run_id")
+
+    async def upload_image(self, image_path):
+        """Upload an ad image. Returns the image hash."""
+        from pathlib import Path
+        path = Path(image_path)
+        with open(path, "rb") as f:
+            result = await self._request(
+                "POST",
+                f"{self.act_id}/adimages",
+                files={"filename": (path.name, f, "image/png")},
+            )
+        if self.dry_run:
+            return "dry_run_hash"
+        return self._image_hash(result)
+
+    async def create_campaign(self, name, objective="OUTCOME_TRAFFIC", status="PAUSED", special_ad_categories=None):
+        """Create an ad campaign. Returns the campaign ID."""
+        return await self._create(
+            f"{self.act_id}/campaigns", self._campaign_params,
+            name, objective, status, special_ad_categories,
+        )
+
+    async def create_ad_set(self, name, campaign_id, daily_budget, targeting,
+                            optimization_goal="LINK_CLICKS", billing_event="IMPRESSIONS",
+                            bid_strategy="LOWEST_COST_WITHOUT_CAP", status="PAUSED"):
+        """Create an ad set with targeting. Returns the ad set ID."""
+        return await self._create(
+            f"{self.act_id}/adsets", self._ad_set_params,
+            name, campaign_id, daily_budget, targeting,
+            optimization_goal, billing_event, bid_strategy, status,
+        )
+
+    async def create_ad_creative(self, name, image_hash, primary_text, headline, description, link,
+                                 cta="LEARN_MORE"):
+        """Create an ad creative. Returns the creative ID."""
+        return await self._create(
+            f"{self.act_id}/adcreatives", self._ad_creative_params,
+            name, image_hash, primary_text, headline, description, link, cta,
+        )
+
+    async def create_ad(self, name, ad_set_id, creative_id, status="PAUSED"):
+        """Create an ad. Returns the ad ID."""
+        return await self._create(
+            f"{self.act_id}/ads", self._ad_params,
+            name, ad_set_id, creative_id, status,
+        )
+
+
 # ---------------------------------------------------------------------------
 # Helper
 # ---------------------------------------------------------------------------
 
-def _get_api(dry_run: bool = False) -> MetaAdsAPI:
-    return MetaAdsAPI(
+def _build_api(dry_run: bool = False, cls=MetaAdsAPI):
+    return cls(
         access_token=os.environ["META_ACCESS_TOKEN"],
         ad_account_id=os.environ["META_AD_ACCOUNT_ID"],
         page_id=os.environ["META_PAGE_ID"],
@@ -216,6 +480,64 @@ def _get_api(dry_run: bool = False) -> MetaAdsAPI:
     )
 
 
+@lru_cache(maxsize=1)
+def _get_live_api() -> MetaAdsAPI:
+    # Reused across tool calls so the pooled HTTPS connection stays warm.
+    # Call _get_live_api.cache_clear() after rotating credentials.
+    return _build_api()
+
+
+def _get_async_api(dry_run: bool = False) -> AsyncMetaAdsAPI:
+    # httpx clients are bound to the running event loop, so build one per call.
+    return _build_api(dry_run=dry_run, cls=AsyncMetaAdsAPI)
+
+
+def _get_api(dry_run: bool = False) -> MetaAdsAPI:
+    # Dry-run clients never hit the network, and a fresh one per call keeps
+    # the fake ids starting at dry_run_1 for every tool invocation.
+    if dry_run:
+        return _build_api(dry_run=True)
+    return _get_live_api()
+
+
+async def _gather_all(coros, limit=MAX_WORKERS):
+    """Like asyncio.gather, but cancels and awaits the rest if one fails.
+
+    At most ``limit`` coroutines run at once, matching the client's connection
+    pool. Plain gather leaves siblings running, which would let them outlive the
+    httpx client that the caller closes on the way out.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def _limited(coro):
+        try:
+            async with semaphore:
+                return await coro
+        finally:
+            coro.close()  # no-op once run; avoids "never awaited" if cancelled while queued
+
+    tasks = [asyncio.ensure_future(_limited(c)) for c in coros]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+def _creative_kwargs(ad, image_hash):
+    return {
+        "name": f"{ad['name']} - Creative",
+        "image_hash": image_hash,
+        "primary_text": ad["primary_text"].strip(),
+        "headline": ad.get("headline", ""),
+        "description": ad.get("description", ""),
+        "link": ad["link"],
+        "cta": ad.get("cta", "LEARN_MORE"),
+    }
+
+
 # ---------------------------------------------------------------------------
 # MCP Tools
 # ---------------------------------------------------------------------------
@@ -271,10 +593,14 @@ def create_meta_campaign(
         "ads": [],
     }
 
+    # Image uploads and per-ad creative+ad creation are independent of each
+    # other, so run them concurrently. map() keeps results in input order.
+    max_workers = max(1, min(MAX_WORKERS, len(ads)))
+
     # Upload images
-    image_hashes = {}
-    for ad in ads:
-        image_hashes[ad["name"]] = api.upload_image(ad["image_path"])
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        hashes = ex.map(lambda ad: api.upload_image(ad["image_path"]), ads)
+        image_hashes = dict(zip([ad["name"] for ad in ads], hashes))
 
     # Create campaign
     campaign_id = api.create_campaign(
@@ -296,25 +622,95 @@ def create_meta_campaign(
     result["ad_set_id"] = ad_set_id
 
     # Create creatives and ads
-    for ad in ads:
-        creative_id = api.create_ad_creative(
-            name=f"{ad['name']} - Creative",
-            image_hash=image_hashes[ad["name"]],
-            primary_text=ad["primary_text"].strip(),
-            headline=ad.get("headline", ""),
-            description=ad.get("description", ""),
-            link=ad["link"],
-            cta=ad.get("cta", "LEARN_MORE"),
-        )
-        result["creatives"].append(creative_id)
-
+    def _make_ad(ad):
+        creative_id = api.create_ad_creative(**_creative_kwargs(ad, image_hashes[ad["name"]]))
         ad_id = api.create_ad(
             name=ad["name"],
             ad_set_id=ad_set_id,
             creative_id=creative_id,
             status="PAUSED",
         )
-        result["ads"].append(ad_id)
+        return creative_id, ad_id
+
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        for creative_id, ad_id in ex.map(_make_ad, ads):
+            result["creatives"].append(creative_id)
+            result["ads"].append(ad_id)
+
+    return result
+
+
+@mcp.tool()
+async def create_meta_campaign_async(
+    campaign_name: str,
+    ad_set_name: str,
+    objective: str = "OUTCOME_TRAFFIC",
+    countries: list = ["US"],
+    age_min: int = 18,
+    age_max: int = 65,
+    daily_budget_cents: int = 1000,
+    optimization_goal: str = "LINK_CLICKS",
+    ads: list = [],
+    dry_run: bool = True,
+) -> dict:
+    """Same as create_meta_campaign, but issues the API calls concurrently over asyncio.
+
+    Takes the same arguments and returns the same result. Image uploads and the
+    per-ad creative+ad calls run concurrently, multiplexed over HTTP/2 when
+    available. Prefer this for campaigns with many ads.
+    """
+    targeting = {
+        "countries": countries,
+        "age_min": age_min,
+        "age_max": age_max,
+    }
+
+    result = {
+        "dry_run": dry_run,
+        "campaign_id": None,
+        "ad_set_id": None,
+        "creatives": [],
+        "ads": [],
+    }
+
+    async with _get_async_api(dry_run=dry_run) as api:
+        # Upload images
+        hashes = await _gather_all([api.upload_image(ad["image_path"]) for ad in ads])
+        image_hashes = dict(zip([ad["name"] for ad in ads], hashes))
+
+        # Create campaign
+        campaign_id = await api.create_campaign(
+            name=campaign_name,
+            objective=objective,
+            status="PAUSED",
+        )
+        result["campaign_id"] = campaign_id
+
+        # Create ad set
+        ad_set_id = await api.create_ad_set(
+            name=ad_set_name,
+            campaign_id=campaign_id,
+            daily_budget=daily_budget_cents,
+            targeting=targeting,
+            optimization_goal=optimization_goal,
+            status="PAUSED",
+        )
+        result["ad_set_id"] = ad_set_id
+
+        # Create creatives and ads
+        async def _make_ad(ad):
+            creative_id = await api.create_ad_creative(**_creative_kwargs(ad, image_hashes[ad["name"]]))
+            ad_id = await api.create_ad(
+                name=ad["name"],
+                ad_set_id=ad_set_id,
+                creative_id=creative_id,
+                status="PAUSED",
+            )
+            return creative_id, ad_id
+
+        for creative_id, ad_id in await _gather_all([_make_ad(ad) for ad in ads]):
+            result["creatives"].append(creative_id)
+            result["ads"].append(ad_id)
 
     return result
 
@@ -327,9 +723,18 @@ def get_campaign_status(campaign_id: str) -> dict:
     with their statuses and budgets.
     """
     api = _get_api()
-    campaign = api.get_campaign(campaign_id, fields="id,name,status,objective,daily_budget")
-    ad_sets = api.get_ad_sets(campaign_id, fields="id,name,status,daily_budget")
-    ads = api.get_ads(campaign_id, fields="id,name,status,effective_status")
+    campaign, ad_sets, ads = api.batch([
+        {"method": "GET", "relative_url": f"{campaign_id}?fields=id,name,status,objective,daily_budget"},
+        {"method": "GET", "relative_url": f"{campaign_id}/adsets?fields=id,name,status,daily_budget"},
+        {"method": "GET", "relative_url": f"{campaign_id}/ads?fields=id,name,status,effective_status"},
+    ])
+    ad_sets = ad_sets.get("data", [])
+    ads = ads.get("data", [])
+
+    # The batch only requests the fields we return, so reuse the parsed
+    # dicts rather than copying them; ad sets just need the budget renamed.
+    for s in ad_sets:
+        s["daily_budget_cents"] = s.pop("daily_budget", None)
 
     return {
         "campaign": {
@@ -338,24 +743,8 @@ def get_campaign_status(campaign_id: str) -> dict:
             "status": campaign.get("status"),
             "objective": campaign.get("objective"),
         },
-        "ad_sets": [
-            {
-                "id": s.get("id"),
-                "name": s.get("name"),
-                "status": s.get("status"),
-                "daily_budget_cents": s.get("daily_budget"),
-            }
-            for s in ad_sets
-        ],
-        "ads": [
-            {
-                "id": a.get("id"),
-                "name": a.get("name"),
-                "status": a.get("status"),
-                "effective_status": a.get("effective_status"),
-            }
-            for a in ads
-        ],
+        "ad_sets": ad_sets,
+        "ads": ads,
     }
 
 